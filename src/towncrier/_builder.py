@@ -238,7 +238,7 @@ def render_issue(issue_format: str | None, issue: str) -> str:
 
 
 def render_fragments(
-    template: str,
+    template: str | Template,
     issue_format: str | None,
     fragments: Mapping[str, Mapping[str, Mapping[str, Sequence[str]]]],
     definitions: Mapping[str, Mapping[str, Any]],
@@ -251,9 +251,15 @@ def render_fragments(
 ) -> str:
     """
     Render the fragments into a news file.
+
+    *template* is either the template source or an already compiled
+    ``jinja2.Template``.
     """
 
-    jinja_template = Template(template, trim_blocks=True)
+    if isinstance(template, Template):
+        jinja_template = template
+    else:
+        jinja_template = Template(template, trim_blocks=True)
 
     data: dict[str, dict[str, dict[str, list[str]]]] = OrderedDict()
 
@@ -11,21 +11,39 @@ from __future__ import annotations
 import os
 import sys
 
-from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import click
 
 from click import Context, Option
 
-from towncrier import _git
-
-from ._builder import find_fragments, render_fragments, split_fragments
-from ._project import get_project_name, get_version
 from ._settings import ConfigError, config_option_help, load_config_from_options
-from ._writer import append_to_newsfile
+
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+
+@lru_cache(maxsize=8)
+def _load_compiled_template(path: str, mtime_ns: int, size: int) -> Template:
+    """
+    Read and compile the news template at *path*.
+
+    *mtime_ns* and *size* are only part of the cache key, so that edits to
+    the template invalidate the cached copy, even when made within the
+    timestamp resolution of the file system.
+    """
+    from jinja2 import Template
+
+    with open(path, encoding="utf-8") as tmpl:
+        template: Template = Template(tmpl.read(), trim_blocks=True)
+    return template
 
 
 def _get_date() -> str:
+    from datetime import date
+
     return date.today().isoformat()
 
 
@@ -142,22 +160,29 @@ def __main(
     """
     The main entry point.
     """
+    # Imported here, so that importing this module as a library stays cheap.
+    from ._builder import find_fragments, render_fragments, split_fragments
+    from ._project import get_project_name, get_version
+
     base_directory, config = load_config_from_options(directory, config_file)
     to_err = draft
 
     click.echo("Loading template...", err=to_err)
-    with open(config.template, "rb") as tmpl:
-        template = tmpl.read().decode("utf8")
+    template_path = os.path.abspath(config.template)
+    template_stat = os.stat(template_path)
+    template = _load_compiled_template(
+        template_path, template_stat.st_mtime_ns, template_stat.st_size
+    )
 
     click.echo("Finding news fragments...", err=to_err)
 
+    package_dir = os.path.abspath(os.path.join(base_directory, config.package_dir))
+
     if config.directory is not None:
         fragment_base_directory = os.path.abspath(config.directory)
         fragment_directory = None
     else:
-        fragment_base_directory = os.path.abspath(
-            os.path.join(base_directory, config.package_dir, config.package)
-        )
+        fragment_base_directory = os.path.join(package_dir, config.package)
         fragment_directory = "newsfragments"
 
     fragment_contents, fragment_filenames = find_fragments(
@@ -176,19 +201,14 @@ def __main(
     if project_version is None:
         project_version = config.version
         if project_version is None:
-            project_version = get_version(
-                os.path.join(base_directory, config.package_dir), config.package
-            ).strip()
+            project_version = get_version(package_dir, config.package).strip()
 
     if project_name is None:
         project_name = config.name
         if not project_name:
             package = config.package
             if package:
-                project_name = get_project_name(
-                    os.path.abspath(os.path.join(base_directory, config.package_dir)),
-                    package,
-                )
+                project_name = get_project_name(package_dir, package)
             else:
                 # Can't determine a project_name, but maybe it is not needed.
                 project_name = ""
@@ -228,13 +248,8 @@ def __main(
     )
 
     if render_title_separately:
-        content = "\n".join(
-            [
-                top_line,
-                config.underlines[0] * len(top_line),
-                rendered,
-            ]
-        )
+        underline = config.underlines[0] * len(top_line)
+        content = f"{top_line}\n{underline}\n{rendered}"
     else:
         content = rendered
 
@@ -247,6 +262,11 @@ def __main(
         click.echo(content)
         return
 
+    # Only needed when actually writing, so a draft doesn't pay for them.
+    from towncrier import _git
+
+    from ._writer import append_to_newsfile
+
     click.echo("Writing to newsfile...", err=to_err)
     news_file = config.filename
 
@@ -300,8 +320,7 @@ def should_remove_fragment_files(
             click.echo("I want to remove the following files:")
     finally:
         # Will always be printed, even for answer_keep to help with possible troubleshooting
-        for filename in fragment_filenames:
-            click.echo(filename)
+        click.echo("\n".join(fragment_filenames))
 
     if answer_yes or click.confirm("Is it okay if I remove those files?", default=True):
         return True
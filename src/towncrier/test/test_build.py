@@ -1233,3 +1233,50 @@ Deprecations and Removals
 
         self.assertEqual(0, result.exit_code, result.output)
         self.assertEqual(expected_output, result.output)
+
+    @with_isolated_runner
+    def test_template_changed_between_builds(self, runner):
+        """
+        The compiled template is cached, but an edit to the template file is
+        picked up by the next build.
+        """
+        setup_simple_project(extra_config='template = "template.rst"\n')
+        Path("template.rst").write_text("First template\n")
+
+        result = runner.invoke(_main, ["--draft", "--date", "01-01-2001"])
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("First template", result.output)
+
+        Path("template.rst").write_text("Second template\n")
+        # Make sure the modification time changes, even on file systems
+        # with a coarse timestamp resolution.
+        mtime = os.stat("template.rst").st_mtime + 10
+        os.utime("template.rst", (mtime, mtime))
+
+        result = runner.invoke(_main, ["--draft", "--date", "01-01-2001"])
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("Second template", result.output)
+        self.assertNotIn("First template", result.output)
+
+    @with_isolated_runner
+    def test_template_changed_within_same_mtime(self, runner):
+        """
+        An edit to the template file is picked up by the next build, even if
+        it leaves the modification time unchanged.
+        """
+        setup_simple_project(extra_config='template = "template.rst"\n')
+        Path("template.rst").write_text("First template\n")
+        mtime_ns = os.stat("template.rst").st_mtime_ns
+
+        result = runner.invoke(_main, ["--draft", "--date", "01-01-2001"])
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("First template", result.output)
+
+        Path("template.rst").write_text("Second, longer template\n")
+        # Simulate a rewrite within the file system's timestamp resolution.
+        os.utime("template.rst", ns=(mtime_ns, mtime_ns))
+
+        result = runner.invoke(_main, ["--draft", "--date", "01-01-2001"])
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("Second, longer template", result.output)
+        self.assertNotIn("First template", result.output)